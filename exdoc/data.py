@@ -4,19 +4,24 @@
 class DictProxy(dict, object):
     """ Dictionary with attributes proxied to indicies (except for those starting with '_') """
 
+    # A new instance is already an empty dict: subclasses that only set their fields
+    # don't need to call `__init__()` of their base.
+    # The hot ones fill their fields with a single `dict.__init__()` call:
+    # that's much cheaper than going through `__setattr__()` for every field.
+
     def __init__(self, *args, **kwargs):
         super(DictProxy, self).__init__(*args, **kwargs)
 
     def __getattr__(self, key):
-        if key.startswith('_'):
+        if key[:1] == '_':
             return object.__getattribute__(self, key)
         return self[key]
 
     def __setattr__(self, key, value):
-        if key.startswith('_'):
+        if key[:1] == '_':
             object.__setattr__(self, key, value)
         else:
-            self[key] = value
+            dict.__setitem__(self, key, value)
 
     def update(self, *args, **kwargs):
         """ A handy update() method which returns self :)
@@ -38,9 +43,7 @@ class ExceptionDoc(DictProxy):
         :param doc: Description text
         :type doc: str
         """
-        super(ExceptionDoc, self).__init__()
-        self.name = name
-        self.doc = doc
+        dict.__init__(self, name=name, doc=doc)
 
 
 class ValueDoc(DictProxy):
@@ -52,9 +55,7 @@ class ValueDoc(DictProxy):
         :param type: Value type, if any
         :type type: str|None
         """
-        super(ValueDoc, self).__init__()
-        self.doc = doc
-        self.type = type
+        dict.__init__(self, doc=doc, type=type)
 
 
 class ArgumentDoc(ValueDoc):
@@ -68,8 +69,7 @@ class ArgumentDoc(ValueDoc):
         :param type: Argument type, if any
         :type type: str|None
         """
-        super(ArgumentDoc, self).__init__(doc, type)
-        self.name = name
+        dict.__init__(self, doc=doc, type=type, name=name)
 
 
 class ArgumentSpec(DictProxy):
@@ -89,13 +89,11 @@ class ArgumentSpec(DictProxy):
         :param keywords: **kwargs indicator
         :type keywords: bool
         """
-        super(ArgumentSpec, self).__init__()
-        self.name = name
-        self.type = type
-        if varargs:  self.name =  '*' + self.name
-        if keywords: self.name = '**' + self.name
+        if varargs:  name =  '*' + name
+        if keywords: name = '**' + name
+        dict.__init__(self, name=name, type=type)
         if default is not self.NODEFAULT:
-            self.default = default
+            self['default'] = default
 
 
 class Argument(ArgumentSpec, ArgumentDoc):
@@ -107,13 +105,19 @@ class Argument(ArgumentSpec, ArgumentDoc):
         :param doc: Argument doc, if any
         :type doc: ArgumentDoc|None
         """
-        dict.__init__(self)
-        self.update(doc or ArgumentDoc(spec.name))
-        self.update(spec)
+        # Merge both into self; the spec has priority.
+        # Same keys as `ArgumentDoc(spec.name)` would have, without creating one.
+        if doc:
+            dict.update(self, doc)
+        else:
+            self['doc'] = ''
+            self['type'] = None
+            self['name'] = spec.name
+        dict.update(self, spec)
 
         # If argspec has no type, get it from the doc
-        if spec.type is None and doc:
-            self.type = doc.type
+        if spec['type'] is None and doc:
+            self['type'] = doc['type']
 
 
 class Docstring(DictProxy):
@@ -126,11 +130,7 @@ class Docstring(DictProxy):
     """
 
     def __init__(self, module=None, qualname=None, doc=''):
-        super(Docstring, self).__init__()
-        self.module = module
-        self.name = qualname.rsplit('.', 1)[-1]
-        self.qualname = qualname
-        self.doc = doc
+        dict.__init__(self, module=module, name=qualname.rpartition('.')[2], qualname=qualname, doc=doc)
 
 
 class FDocstring(Docstring):
@@ -151,50 +151,45 @@ class FDocstring(Docstring):
     """
 
     def __init__(self, module=None, qualname=None, doc='', clsdoc='', args=(), ret=None, exc=(), example=None):
-        super(FDocstring, self).__init__(module, qualname, doc)
-        self.clsdoc = clsdoc
-        self.args = args
-        self.ret = ret
-        self.exc = exc
-        self.signature = None
-        self.tsignature = None
-        self.rtsignature = None
-        self.qsignature = None
-        self.qtsignature = None
-        self.qrtsignature = None
-        self.example = example
+        Docstring.__init__(self, module, qualname, doc)
+        dict.update(self,
+                    clsdoc=clsdoc, args=args, ret=ret, exc=exc,
+                    signature=None, tsignature=None, rtsignature=None,
+                    qsignature=None, qtsignature=None, qrtsignature=None,
+                    example=example)
 
     def update_signature(self):
         # Prepare arguments
         args_typed = []
         args_untyped = []
         for a in self.args:
-            a_type = ': {}'.format(a.type) if a.type else ''
-            a_default = '={}'.format(a.default.__name__ if isinstance(a.default, type) else repr(a.default)) \
-                        if 'default' in a else ''
+            a_name = a.name
+            a_default = ''
+            if 'default' in a:
+                a_default = '=' + (a.default.__name__ if isinstance(a.default, type) else repr(a.default))
 
             # untyped
-            args_untyped.append(a.name + a_default)
-            args_typed.append(a.name + a_type + a_default)
+            args_untyped.append(a_name + a_default)
+            args_typed.append('{}: {}{}'.format(a_name, a.type, a_default) if a.type else a_name + a_default)
+
+        # Join once, reuse for every signature
+        name, qualname = self.name, self.qualname
+        untyped = ', '.join(args_untyped)
+        typed = ', '.join(args_typed)
+        # -> returns
+        rtype_str = ' -> {}'.format(self.ret.type) if self.ret and self.ret.type is not None else ''
 
         # untyped
-        self.signature = '{}({})'.format(self.name, ', '.join(args_untyped))
-        self.qsignature = '{}({})'.format(self.qualname, ', '.join(args_untyped))
+        self.signature = '{}({})'.format(name, untyped)
+        self.qsignature = '{}({})'.format(qualname, untyped)
 
         # rtyped
-        self.rtsignature = self.signature
-        self.qrtsignature = self.qsignature
+        self.rtsignature = self.signature + rtype_str
+        self.qrtsignature = self.qsignature + rtype_str
 
         # typed
-        self.tsignature = '{}({})'.format(self.name, ', '.join(args_typed))
-        self.qtsignature = '{}({})'.format(self.qualname, ', '.join(args_typed))
-        # -> returns
-        if self.ret and self.ret.type is not None:
-            rtype_str = ' -> {}'.format(self.ret.type)
-            self.tsignature += rtype_str
-            self.qtsignature += rtype_str
-            self.rtsignature += rtype_str
-            self.qrtsignature += rtype_str
+        self.tsignature = '{}({}){}'.format(name, typed, rtype_str)
+        self.qtsignature = '{}({}){}'.format(qualname, typed, rtype_str)
 
 #endregion
 
@@ -222,14 +217,13 @@ class SaModelDoc(DictProxy):
         :param relations: Relationships
         :type relations: list[SaRelationshipDoc]
         """
-        super(SaModelDoc, self).__init__()
         self.name = name
         self.table = tuple(table)
         self.doc = doc
         self.columns = columns
         self.primary = tuple(primary)
         self.foreign = tuple(foreign)
-        self.unique = tuple(tuple(u) for u in unique)
+        self.unique = tuple([tuple(u) for u in unique])
         self.relations = relations
 
 
@@ -246,7 +240,6 @@ class SaColumnDoc(DictProxy):
         :param null: Nullable?
         :type null: bool
         """
-        super(SaColumnDoc, self).__init__()
         self.key = key
         self.type = type + (' NULL' if null else ' NOT NULL')
         self.doc = doc
@@ -265,7 +258,6 @@ class SaForeignkeyDoc(DictProxy):
         :param ondelete: Behavior on delete
         :type ondelete: str|None
         """
-        super(SaForeignkeyDoc, self).__init__()
         self.key = key
         self.target = target
         self.onupdate = onupdate
@@ -287,7 +279,6 @@ class SaRelationshipDoc(DictProxy):
         :param uselist: -to-Many?
         :type uselist: bool
         """
-        super(SaRelationshipDoc, self).__init__()
         self.key = key + ('[]' if uselist else '')
         self.model = model
         self.target = '{}({})'.format(self.model, ', '.join(pairs))
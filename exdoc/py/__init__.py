@@ -1,9 +1,9 @@
 """ Helpers for Python objects """
 
 import inspect
-import collections
 import re
 from inspect import cleandoc
+from sys import intern as _sys_intern
 
 from .. import data
 
@@ -40,7 +40,7 @@ def _get_callable(obj, of_class = None):
     # Cases
     o = obj
 
-    if inspect.isclass(obj):
+    if isinstance(obj, type):
         try:
             o = obj.__init__
             of_class = obj
@@ -56,26 +56,38 @@ def _doc_parse(doc, module=None, qualname=None):
 
     :rtype: data.FDocstring
     """
+    # Both formats need colons: a docstring without any is plain text
+    if ':' not in doc:
+        return data.FDocstring(module=module, qualname=qualname, doc=cleandoc(doc).strip(), args=[], exc=[])
+
     parser = _doc_parse__detect_format(doc, module, qualname)
     return parser(doc, module, qualname)
 
 
 def _doc_parse__detect_format(doc, module=None, qualname=None):
     """ Detect docstring format and get a callable that will process it """
-    # Try detectors
-    found_sphinx_strict = sphinx_tags_detector_rex.search(doc) is not None
-    found_google_strict = google_sections_detector_rex.search(doc) is not None
-    found_sphinx_relaxed = sphinx_tags_rex.search(doc) is not None
-    found_google_relaxed = google_sections_rex.search(doc) is not None
+    # Try detectors: all of them in a single pass
+    found_sphinx = found_google_strict = found_google_relaxed = False
+    for m in _format_detector_rex.finditer(doc):
+        section = m.group('google')
+        if section is None:
+            found_sphinx = True
+        elif section in google_detector_sections:
+            found_google_strict = True
+        else:
+            found_google_relaxed = True
+
+        # Nothing else can change the outcome
+        if found_sphinx and found_google_strict:
+            break
 
     # Choose: first, try strict.
     # If it didn't work, try relaxed
-    if found_sphinx_strict or found_google_strict:
-        found_sphinx = found_sphinx_strict
+    # Sphinx is always strict: it can be detected unambiguously
+    if found_sphinx or found_google_strict:
         found_google = found_google_strict
     else:
         # Prefer sphinx over Google here
-        found_sphinx = found_sphinx_relaxed
         found_google = found_google_relaxed
 
     # Result?
@@ -107,13 +119,20 @@ known_google_secions = {
     "Returns": "ret",
     "Yields": "ret",
 }
+assert all(re.escape(s) == s for s in known_google_secions), 'Google section names must be plain words'
 # And some regular expressions to detect and parse them
-_google_sections_mkrex = lambda known_google_secions: \
-    re.compile(r'^(' + '|'.join(map(re.escape, known_google_secions)) + r'):\s*$\s{4,}', re.MULTILINE)
-google_sections_rex = _google_sections_mkrex(known_google_secions)
-google_sections_detector_rex = _google_sections_mkrex(
-    set(known_google_secions) - {'Example', 'Examples'}  # they give a lot of false positives
-)
+# Longest names go first: "Arguments" is tried before "Args"
+_google_sections_mkpattern = lambda known_google_secions, group='(': \
+    r'^' + group + '|'.join(sorted(known_google_secions, key=len, reverse=True)) + r'):\s*$\s{4,}'
+google_sections_rex = re.compile(_google_sections_mkpattern(known_google_secions), re.MULTILINE)
+# Sections reliable enough for strict detection
+google_detector_sections = set(known_google_secions) - {'Example', 'Examples'}  # they give a lot of false positives
+google_sections_detector_rex = re.compile(_google_sections_mkpattern(google_detector_sections), re.MULTILINE)
+# Sections that have a "name: text" structure or a "name (type): text" structure
+google_structured_sections = {'args', 'excs', 'attrs'}
+google_structured_sections_rex = re.compile(r'^(\S+)\s*(?:\(([^)]+)\))?\s*:', re.MULTILINE)
+# The return type: "type: text"
+google_return_type_rex = re.compile(r'^(\S+):')
 
 
 def _doc_parse_google(doc, module=None, qualname=None):
@@ -121,28 +140,22 @@ def _doc_parse_google(doc, module=None, qualname=None):
 
     :rtype: data.FDocstring
     """
-    # Sections that have a "name: text" structure or a "name (type): text" structure
-    structured_sections = {'args', 'excs', 'attrs'}
-    structured_sections_rex = re.compile(r'^(\S+)\s*(?:\(([^)]+)\))?\s*:', re.MULTILINE)
-
-    # Parse the return type
-    return_type_rex = re.compile(r'^(\S+):')
-
     # Dedent the whole thing first
     doc = cleandoc(doc)
     # Now we can count that sections are at column 0
 
     # Info variables
-    doc = doc  # the leftover docstring
     doc_args = []
     doc_exc = []
     doc_ret = None
     doc_example = None
 
     # Go through sections in reverse
-    # This way, it's always easy to copy the pieces
-    for section_name_orig, section_text, doc in _parse_sections_in_reverse(google_sections_rex, doc):
-        section_name = known_google_secions[section_name_orig]  # Normalized section name
+    # When a section is repeated, the first one wins: it's handled last
+    doc, sections = _parse_sections(google_sections_rex, doc)
+    section_names, structured_sections = known_google_secions, google_structured_sections
+    for section_name_orig, section_text in reversed(sections):
+        section_name = section_names[section_name_orig]  # Normalized section name
 
         # Parse the section
         section_structure = []
@@ -151,14 +164,13 @@ def _doc_parse_google(doc, module=None, qualname=None):
             section_text = cleandoc(section_text)
 
             # Parse every item
-            for item_name, item_type, item_text, section_text \
-                in _parse_sections_in_reverse(structured_sections_rex, section_text):
-                    section_structure.append((item_name, item_type, cleandoc(item_text)))
-            # Finalize
-            section_structure.reverse()
-            section_text = section_text.strip()
-
-            # Test
+            section_text, items = _parse_sections(google_structured_sections_rex, section_text)
+            # Single-line items (the most common) have nothing to dedent: they're stripped already
+            section_structure = [(item_name, item_type,
+                                  cleandoc(item_text) if '\n' in item_text else item_text.expandtabs())
+                                 for item_name, item_type, item_text in items]
+
+            # Test: nothing should remain before the first item
             if section_text != '':
                 raise ValueError(
                     "There may be a typo in section '{section}' of {module}.{qualname}.\n"
@@ -171,18 +183,18 @@ def _doc_parse_google(doc, module=None, qualname=None):
         # Handle section
         if section_name == 'args':
             for arg_name, arg_type, arg_descr in section_structure:
-                doc_args.append(data.ArgumentDoc(arg_name.lstrip('*'), arg_descr, arg_type))
+                doc_args.append(data.ArgumentDoc(_intern(arg_name.lstrip('*')), arg_descr, _intern(arg_type)))
         elif section_name == 'excs':
             for exc_class, _, exc_descr in section_structure:
-                doc_exc.append(data.ExceptionDoc(exc_class, exc_descr))
+                doc_exc.append(data.ExceptionDoc(_intern(exc_class), exc_descr))
         elif section_name == 'examples':
             doc_example = cleandoc(section_text)
         elif section_name == 'ret':
             # The return type might be in the very head of the string
             ret_type = None
-            m = return_type_rex.match(section_text)
+            m = google_return_type_rex.match(section_text)
             if m:
-                ret_type = m.group(1).strip()
+                ret_type = _intern(m.group(1).strip())
                 section_text = cleandoc(section_text[m.end():])
             # Done
             doc_ret = data.ValueDoc(section_text, ret_type)
@@ -198,23 +210,32 @@ def _doc_parse_google(doc, module=None, qualname=None):
                            doc=doc, args=doc_args, exc=doc_exc, ret=doc_ret, example=doc_example)
 
 # The list of tags used with Sphinx
+# Every tag is normalized to: (what it documents, the field it fills in)
 known_sphinx_tags = {
-    'param': 'arg',
-    'type': 'arg-type',
-    'return': 'ret',
-    'returns': 'ret',
-    'rtype': 'ret-type',
-    'exception': 'exc',
-    'except': 'exc',
-    'raise': 'exc',
-    'raises': 'exc',
+    'param': ('arg', 'doc'),
+    'type': ('arg', 'type'),
+    'return': ('ret', 'doc'),
+    'returns': ('ret', 'doc'),
+    'rtype': ('ret', 'type'),
+    'exception': ('exc', 'doc'),
+    'except': ('exc', 'doc'),
+    'raise': ('exc', 'doc'),
+    'raises': ('exc', 'doc'),
 }
 # And regexes to parse and detect it
-_sphinx_tags_mkrex = lambda sphinx_tags: \
-    re.compile(r'^:(' + '|'.join(map(re.escape, sphinx_tags)) + r')\s*(\S+)?\s*:', re.MULTILINE)
-sphinx_tags_rex = _sphinx_tags_mkrex(known_sphinx_tags)
+# The tag, then an optional argument: all on one line; no whitespace can be matched in more than one way
+_sphinx_tags_mkpattern = lambda sphinx_tags, group='(': \
+    r'^:' + group + '|'.join(map(re.escape, sphinx_tags)) + r')(?:[ \t]+(\S+))?[ \t]*:'
+sphinx_tags_rex = re.compile(_sphinx_tags_mkpattern(known_sphinx_tags), re.MULTILINE)
 sphinx_tags_detector_rex = sphinx_tags_rex  # reuse, because Sphinx format can be detected unambiguosly
 
+# Detects both formats in a single pass. Group 'google' has the name of a Google section; a Sphinx tag otherwise
+_format_detector_rex = re.compile(
+    _sphinx_tags_mkpattern(known_sphinx_tags, '(?:') + '|' +
+    _google_sections_mkpattern(known_google_secions, '(?P<google>'),
+    re.MULTILINE
+)
+
 
 def _doc_parse_sphinx(doc, module=None, qualname=None):
     """ Parse docstring into a dict, format: Sphinx (reST)
@@ -226,45 +247,69 @@ def _doc_parse_sphinx(doc, module=None, qualname=None):
     # Now we can count that sections are at column 0
 
     # Match tags
-    doc = doc  # the leftover docstring
-    collect_args = {}
+    # When a field is given more than once, the first tag wins
+    collect_args = {}  # arg name => fields, in the order of the docstring
     collect_ret = {}
-    doc_args = []
     doc_exc = []
-    for tag, arg, value, doc in _parse_sections_in_reverse(sphinx_tags_rex, doc):
-        tag = known_sphinx_tags[tag]  # Normalized tag name
-
-        # Handle tag: collect data
-        if tag == 'exc':
-            doc_exc.append(data.ExceptionDoc(arg, value))
-        elif tag in ('ret', 'ret-type'):
+    doc, tags = _parse_sections(sphinx_tags_rex, doc)
+    ExceptionDoc = data.ExceptionDoc
+    for tag, arg, value in tags:
+        kind, field = known_sphinx_tags[tag]  # Normalized tag
+        if field == 'type':
+            value = _intern(value)
+
+        # Handle tag: collect data. Arguments go first: they're the most common
+        if kind == 'arg':
             # Collect fields 1 by 1
-            collect_ret[{'ret': 'doc', 'ret-type': 'type'}[tag]] = value
-        elif tag in ('arg', 'arg-type'):
-            # Init new collection
-            if arg not in collect_args:
-                doc_args.append(arg)  # add name for now, then map() replace with classes
-                collect_args[arg] = {}
+            fields = collect_args.get(arg)
+            if fields is None:
+                fields = collect_args[arg] = {}
+            fields.setdefault(field, value)
+        elif kind == 'ret':
             # Collect fields 1 by 1
-            collect_args[arg][{'arg': 'doc', 'arg-type': 'type'}[tag]] = value
+            collect_ret.setdefault(field, value)
+        elif kind == 'exc':
+            doc_exc.append(ExceptionDoc(_intern(arg), value))
         else:
-            raise AssertionError('Unknown tag type: {}'.format(tag))
+            raise AssertionError('Unknown tag type: {}'.format(kind))
 
     # Merge collected data
     doc_ret = data.ValueDoc(**collect_ret) if collect_ret else None
-    doc_args = map(lambda name: data.ArgumentDoc(name=name, **collect_args[name]), collect_args)
+    ArgumentDoc = data.ArgumentDoc
+    doc_args = [ArgumentDoc(_intern(name), **fields) for name, fields in collect_args.items()]
 
     # Finish
     return data.FDocstring(module=module, qualname=qualname, doc=doc, args=doc_args, exc=doc_exc, ret=doc_ret)
 
 
-def _parse_sections_in_reverse(rex, text):
-    """ Keep chopping the matching `rex` sections from the `text` docstring """
-    for m in reversed(list(rex.finditer(text))):
-        groups = m.groups()  # the groups matched by the RegExp
-        section_text = text[m.end():].strip()  # the text after the section header (its body)
-        text = text[:m.start()]  # the remaining portion of the string
-        yield (*groups, section_text, text.strip())
+def _intern(s):
+    """ Intern a short name (argument, type, exception): they repeat across docstrings.
+
+    Long strings are rarely repeated, and are returned as is. So is None.
+    """
+    return _sys_intern(s) if s is not None and len(s) < 32 else s
+
+
+def _parse_sections(rex, text):
+    """ Split the `text` docstring into sections that start with the matching `rex` headers
+
+    Goes forward in a single pass: every section body is sliced out of `text` exactly once.
+
+    :return: (head, sections): the text before the first section, and a list of `(*groups, body)` tuples
+    :rtype: (str, list[tuple])
+    """
+    head_end = len(text)
+    sections = []
+    prev = None
+    for m in rex.finditer(text):
+        if prev is None:
+            head_end = m.start()
+        else:
+            sections.append(prev.groups() + (text[prev.end():m.start()].strip(),))
+        prev = m
+    if prev is not None:
+        sections.append(prev.groups() + (text[prev.end():].strip(),))
+    return text[:head_end].strip(), sections
 
 
 def is_method_static(cls, method_name):
@@ -283,39 +328,53 @@ def annotation_to_string(annot):
     # Other types
     s = str(annot)
     # `typing` module inserts `typing.` prefixes which are ugly. Remove.
-    s = s.replace('typing.', '')
-    return s
+    if 'typing.' in s:
+        s = s.replace('typing.', '')
+    # Short names repeat a lot: share them
+    return _intern(s)
 
 def _argspec(func):
-    """ For a callable, get the full argument spec, and its return type (if any) """
-    assert isinstance(func, collections.Callable), 'Argument must be a callable'
+    """ For a callable, get the full argument spec, and its return type (if any)
+
+    :rtype: (list[data.ArgumentSpec], str|None)
+    """
+    assert callable(func), 'Argument must be a callable'
 
+    # Built-ins without a text signature (e.g. `iter()`) can't be inspected: skip the raise & catch
+    if inspect.isbuiltin(func) and func.__text_signature__ is None:
+        return [], None
+
+    # getfullargspec() keeps the bound argument (`self`, `cls`) of bound methods, built-in ones included:
+    # _docspec() relies on it when it drops the first argument of methods
     try: sp = inspect.getfullargspec(func)
     except TypeError:
-        # inspect.getargspec() fails for built-in functions
+        # inspect.getfullargspec() fails for some other C callables
         return [], None
 
     # Collect arguments with defaults
+    ArgumentSpec = data.ArgumentSpec
+    annotations = sp.annotations
+    defaults = sp.defaults or ()
+    defaults_start = len(sp.args) - len(defaults)
     ret = []
-    defaults_start = len(sp.args) - len(sp.defaults) if sp.defaults else len(sp.args)
     for i, name in enumerate(sp.args):
         # Arg name, annotation
-        arg = data.ArgumentSpec(name=name,
-                                type=annotation_to_string(sp.annotations.get(name, None)))
-        # Arg default value
+        arg = ArgumentSpec(name=name,
+                           type=annotation_to_string(annotations.get(name, None)))
+        # Arg default value: set directly, as it may be anything, `NotImplemented` included
         if i >= defaults_start:
-            arg['default'] = sp.defaults[i - defaults_start]
+            arg['default'] = defaults[i - defaults_start]
         # Done
         ret.append(arg)
 
     # *args, **kwargs
     if sp.varargs:
-        ret.append(data.ArgumentSpec(sp.varargs, varargs=True))
+        ret.append(ArgumentSpec(sp.varargs, varargs=True))
     if sp.varkw:
-        ret.append(data.ArgumentSpec(sp.varkw, keywords=True))
+        ret.append(ArgumentSpec(sp.varkw, keywords=True))
 
     # Finish
-    return ret, annotation_to_string(sp.annotations.get('return', None))
+    return ret, annotation_to_string(annotations.get('return', None))
 
 
 def _docspec(func, module=None, qualname=None, of_class=None):
@@ -327,6 +386,10 @@ def _docspec(func, module=None, qualname=None, of_class=None):
     sp, return_type = _argspec(func)
     doc = _doc_parse(getdoc(func), module=module, qualname=qualname)
 
+    # Args shift: dump `self`
+    if of_class is not None and inspect.isroutine(func) and not is_method_static(of_class, func.__name__):
+        sp = sp[1:]
+
     # Merge args; priority to function signature
     doc_map = {arg.name: arg
                for arg in doc.args}
@@ -341,11 +404,6 @@ def _docspec(func, module=None, qualname=None, of_class=None):
         else:
             doc.ret = data.ValueDoc(type=return_type)
 
-    # Args shift: dump `self`
-    if (inspect.isroutine(func) and of_class is not None) and \
-            (of_class is not None and not is_method_static(of_class, func.__name__)):
-        doc.args = doc.args[1:]
-
     # Signature
     doc.update_signature()
 
@@ -426,10 +484,11 @@ def doc(obj, of_class=None):
     """
     # Special care about properties
     if isinstance(obj, property):
-        docstr = doc(obj.fget)
+        fget = obj.fget
+        docstr = doc(fget)
         # Some hacks for properties
-        docstr.signature = docstr.qsignature= obj.fget.__name__
-        docstr.args = docstr.args[1:]
+        docstr.signature = docstr.qsignature = fget.__name__
+        del docstr.args[:1]  # `self`
         return docstr
 
     # Module
@@ -449,7 +508,7 @@ def doc(obj, of_class=None):
     docstr = _docspec(fun, module=module, qualname=qualname, of_class=of_class)
 
     # Class? Get doc
-    if inspect.isclass(obj):
+    if isinstance(obj, type):
         # Get class doc
         clsdoc = getdoc(obj)
         # Parse docstring and merge into constructor doc
@@ -478,6 +537,48 @@ def doc(obj, of_class=None):
     return docstr
 
 
+def doc_many(objs, of_class=None, workers=1, processes=False):
+    """ Get parsed documentation for many objects at once.
+
+    Same as calling `doc()` for every object, but can spread the work across threads or processes:
+
+    ```python
+    from exdoc import doc_many, getmembers
+
+    doc_many([value for name, value in getmembers(module)], workers=4)
+    ```
+
+    Parsing is CPU-bound, so threads are mostly held back by the GIL. Processes are not,
+    but both the objects and their documentation have to be picklable:
+    module-level functions and classes are fine, lambdas and local classes are not.
+
+    :param objs: Objects to document
+    :type objs: Iterable
+    :param of_class: A class whose methods are being documented
+    :type of_class: class|None
+    :param workers: The number of threads (or processes) to use
+    :type workers: int
+    :param processes: Use a pool of processes rather than threads
+    :type processes: bool
+    :returns: Documentation for every object, in the same order
+    :rtype: list[Docstring|FDocstring|None]
+    """
+    # A list: iterators are consumed once, and len() gives the chunk size
+    # doc() builds a new result for every entry, so callers may modify them
+    objs = list(objs)
+
+    if workers > 1:
+        # Imported here: most users never need a pool
+        import functools
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with pool(workers) as executor:
+            return list(executor.map(functools.partial(doc, of_class=of_class), objs,
+                                     chunksize=max(1, len(objs) // (4 * workers))))
+    else:
+        return [doc(obj, of_class) for obj in objs]
+
+
 def getmembers(obj, *predicates):
     """ Return all the members of an object as a list of `(key, value)` tuples, sorted by name.
 
@@ -494,18 +595,21 @@ def getmembers(obj, *predicates):
     :returns: Sorted list of (name, value) tuples
     :rtype: list[(str, *)]
     """
+    # Only the default predicate: inline it
+    if not predicates:
+        return [(key, value)
+                for key, value in inspect.getmembers(obj)
+                if not key.startswith('_')]
+
     # Add default
-    if not predicates or predicates[0] is not None:
+    if predicates[0] is not None:
         predicates = (lambda key, value: not key.startswith('_'),) + predicates
-    # Build composite predicate
-    def predicate(key_value_tuple):
-        key, value = key_value_tuple
-        for p in predicates:
-            if p is not None and not p(key, value):
-                return False
-        return True
+    # Drop Nones once, not for every member
+    predicates = tuple(p for p in predicates if p is not None)
     # Filter
-    return filter(predicate, inspect.getmembers(obj))
+    return [(key, value)
+            for key, value in inspect.getmembers(obj)
+            if all(p(key, value) for p in predicates)]
 
 
 def subclasses(cls, leaves=False):
@@ -513,16 +617,22 @@ def subclasses(cls, leaves=False):
 
     If `leaves=True`, only returns classes which have no subclasses themselves.
 
+    Every class is listed once, even if it inherits from several classes of the tree.
+
     :type cls: type
     :param leaves: Only return leaf classes
     :type leaves: bool
     :rtype: list[type]
     """
     stack = [cls]
+    seen = set()
     subcls = []
     while stack:
         c = stack.pop()
-        c_subs = c.__subclasses__()
+        if c in seen:
+            continue
+        seen.add(c)
+        c_subs = type.__subclasses__(c)
         stack.extend(c_subs)
         if not leaves or not c_subs:
             subcls.append(c)
@@ -103,14 +103,16 @@ def _model_primary(ins):
     return tuple(c.key for c in ins.primary_key)
 
 
-def _model_foreign(ins):
-    """ Get foreign keys info
+def _model_constraints(ins):
+    """ Get foreign keys and unique constraints info in a single pass over the tables
 
     :type ins: sqlalchemy.orm.mapper.Mapper
-    :rtype: list[SaForeignkeyDoc]
+    :rtype: (list[SaForeignkeyDoc], list[tuple[str]])
     """
     fks = []
+    unique = []
     for t in ins.tables:
+        # Foreign keys
         fks.extend([
             SaForeignkeyDoc(
                 key=fk.column.key,
@@ -119,21 +121,13 @@ def _model_foreign(ins):
                 ondelete=fk.ondelete
             )
             for fk in t.foreign_keys])
-    return fks
-
 
-def _model_unique(ins):
-    """ Get unique constraints info
-
-    :type ins: sqlalchemy.orm.mapper.Mapper
-    :rtype: list[tuple[str]]
-    """
-    unique = []
-    for t in ins.tables:
-        for c in t.constraints:
-            if isinstance(c, UniqueConstraint):
-                unique.append(tuple(col.key for col in c.columns))
-    return unique
+        # Unique constraints
+        unique.extend([
+            tuple(col.key for col in c.columns)
+            for c in t.constraints
+            if isinstance(c, UniqueConstraint)])
+    return fks, unique
 
 
 def _model_relations(ins):
@@ -152,7 +146,8 @@ def _model_relations(ins):
             key=r.key,
             doc=r.doc or '',
             model=target_model_name,
-            pairs=map(lambda a_b_tuple: a_b_tuple[0].key if a_b_tuple[0].key == a_b_tuple[1].key else '{}={}'.format(a_b_tuple[0].key, a_b_tuple[1].key), r.local_remote_pairs),
+            pairs=[a.key if a.key == b.key else '{}={}'.format(a.key, b.key)
+                   for a, b in r.local_remote_pairs],
             uselist=r.uselist
         ))
     return relations
@@ -166,6 +161,7 @@ def doc(model):
     :rtype: SaModelDoc
     """
     ins = inspect(model)
+    foreign, unique = _model_constraints(ins)
 
     return SaModelDoc(
         name=model.__name__,
@@ -173,7 +169,7 @@ def doc(model):
         doc=getdoc(ins.class_),
         columns=_model_columns(ins),
         primary=_model_primary(ins),
-        foreign=_model_foreign(ins),
-        unique=_model_unique(ins),
+        foreign=foreign,
+        unique=unique,
         relations=_model_relations(ins)
     )
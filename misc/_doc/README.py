@@ -1,14 +1,29 @@
 #! /usr/bin/env python
 
-from exdoc import doc, getmembers
+from exdoc import doc, doc_many, getmembers
 import json
+import sys
+from itertools import chain
 
 import exdoc, exdoc.py, exdoc.sa
 
 
+# Objects reachable from several modules are documented once
+# The object is kept alive together with its doc, so that its id() is never reused
+_cache = {}
+
+def cached_doc_many(values):
+    """ Document many objects at once. Objects documented before are taken from the cache """
+    missing = [value for value in values if id(value) not in _cache]
+    for value, value_doc in zip(missing, doc_many(missing)):
+        _cache[id(value)] = (value, value_doc)
+    return [_cache[id(value)][1] for value in values]
+
+
 def docmodule(module):
-    return { name: doc(value)
-             for name, value in list(getmembers(module)) + [('__module__', module)] }
+    members = list(chain(getmembers(module), [('__module__', module)]))
+    return dict(zip((name for name, value in members),
+                    cached_doc_many([value for name, value in members])))
 
 data = {
     'exdoc': {
@@ -18,4 +33,11 @@ data = {
     }
 }
 
-print(json.dumps(data, indent=2))
+# orjson is much faster, but optional
+try:
+    import orjson
+except ImportError:
+    json.dump(data, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+else:
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b'\n')
@@ -1,7 +1,12 @@
+import io
 import unittest
 from typing import Union
 
 import exdoc
+from exdoc import data
+
+# The package documents itself once for the whole module
+_EXDOC_DOC = exdoc.doc(exdoc)
 
 #region Samples
 
@@ -79,175 +84,191 @@ class PyTest(unittest.TestCase):
             expected
         )
 
-    def test_doc(self):
-        """ Test doc() """
-
-        # Module
-        d = exdoc.doc(exdoc)
-        self.assertEqual(d.pop('module'), None)
-        self.assertEqual(d.pop('name'), 'exdoc')
-        self.assertEqual(d.pop('qualname'), 'exdoc')
+    @classmethod
+    def setUpClass(cls):
+        # Every sample is documented once; tests compare copies, never modify them
+        cls.docs = {
+            'h': exdoc.doc(h),
+            'A': exdoc.doc(A),
+            'B': exdoc.doc(B),
+            'C.f': exdoc.doc(C.f, C),
+            'C.s': exdoc.doc(C.s, C),
+            'C.c': exdoc.doc(C.c, C),
+            'C.p': exdoc.doc(C.p),
+        }
+
+    def test_doc_module(self):
+        """ Test doc() on a module """
+        d = dict(_EXDOC_DOC)
         self.assertTrue(d.pop('doc').startswith('Create a python file'))
-        self.assertEqual(d, {})
-
-
-        # Function
-        d = exdoc.doc(h)
-        self.assertEqual(d.pop('module'), 'py-test')
-        self.assertEqual(d.pop('name'), 'h')
-        self.assertEqual(d.pop('qualname'), 'h')
-        self.assertEqual(d.pop('doc'), 'Just a function')
-        self.assertEqual(d.pop('clsdoc'), '')
-        self.assertEqual(d.pop('ret'), {'doc': 'nothing', 'type': 'None'})
-        self.assertEqual(d.pop('signature'),     'h(a, b, c=True, d=1, *args, **kwargs)')
-        self.assertEqual(d.pop('rtsignature'),   'h(a, b, c=True, d=1, *args, **kwargs) -> None')
-        self.assertEqual(d.pop('tsignature'),    'h(a: int, b, c: None=True, d=1, *args, **kwargs) -> None')
-        self.assertEqual(d.pop('qsignature'),    'h(a, b, c=True, d=1, *args, **kwargs)')
-        self.assertEqual(d.pop('qrtsignature'),  'h(a, b, c=True, d=1, *args, **kwargs) -> None')
-        self.assertEqual(d.pop('qtsignature'),   'h(a: int, b, c: None=True, d=1, *args, **kwargs) -> None')
-
-        self.assertEqual(d.pop('args'), [
+        self.assertEqual(d, {
+            'module': None,
+            'name': 'exdoc',
+            'qualname': 'exdoc',
+        })
+
+    def test_doc_function_h(self):
+        """ Test doc() on a function """
+        self.assertEqual(dict(self.docs['h']), {
+            'module': 'py-test',
+            'name': 'h',
+            'qualname': 'h',
+            'doc': 'Just a function',
+            'clsdoc': '',
+            'ret': {'doc': 'nothing', 'type': 'None'},
+            'signature': 'h(a, b, c=True, d=1, *args, **kwargs)',
+            'rtsignature': 'h(a, b, c=True, d=1, *args, **kwargs) -> None',
+            'tsignature': 'h(a: int, b, c: None=True, d=1, *args, **kwargs) -> None',
+            'qsignature': 'h(a, b, c=True, d=1, *args, **kwargs)',
+            'qrtsignature': 'h(a, b, c=True, d=1, *args, **kwargs) -> None',
+            'qtsignature': 'h(a: int, b, c: None=True, d=1, *args, **kwargs) -> None',
+            'args': [
                 {'name': 'a',        'type': 'int',  'doc': 'A-value'},
                 {'name': 'b',        'type': None,   'doc': 'B-value, no type'},
                 {'name': 'c',        'type': 'None', 'doc': '', 'default': True},
                 {'name': 'd',        'type': None,   'doc': '', 'default': 1},
                 {'name': '*args',    'type': None,   'doc': 'Varargs'},
                 {'name': '**kwargs', 'type': None,   'doc': 'Kwargs'},
-            ])
-        self.assertEqual(d.pop('exc'), [
-            {'name': 'AssertionError', 'doc': 'sometimes'}
-        ])
-        self.assertEqual(d.pop('example'), None)
-        self.assertEqual(d, {})
-
-        # Class: A
-        d = exdoc.doc(A)
-        self.assertEqual(d.pop('module'), 'py-test')
-        self.assertEqual(d.pop('name'), 'A')
-        self.assertEqual(d.pop('qualname'), 'A')
-        self.assertEqual(d.pop('doc'), 'Empty class')
-        self.assertEqual(d.pop('clsdoc'), 'Empty class')
-
-        self.assertEqual(d.pop('signature'),    'A(*args, **kwargs)')
-        self.assertEqual(d.pop('tsignature'),   'A(*args, **kwargs)')
-        self.assertEqual(d.pop('rtsignature'),  'A(*args, **kwargs)')
-        self.assertEqual(d.pop('qsignature'),   'A(*args, **kwargs)')
-        self.assertEqual(d.pop('qtsignature'),  'A(*args, **kwargs)')
-        self.assertEqual(d.pop('qrtsignature'), 'A(*args, **kwargs)')
-        self.assertEqual(d.pop('ret'), None)
-        self.assertEqual(d.pop('args'), [
-            {'name': '*args', 'type': None, 'doc': ''},
-            {'name': '**kwargs', 'type': None, 'doc': ''},
-        ])
-        self.assertEqual(d.pop('exc'), [])
-        self.assertEqual(d.pop('example'), None)
-        self.assertEqual(d, {})
-
-        # Class: B
-        d = exdoc.doc(B)
-        self.assertEqual(d.pop('module'), 'py-test')
-        self.assertEqual(d.pop('name'), 'B')
-        self.assertEqual(d.pop('qualname'), 'B')
-        self.assertEqual(d.pop('doc'), 'Constructor')
-        self.assertEqual(d.pop('clsdoc'), 'Class with a constructor')
-        self.assertEqual(d.pop('signature'),    'B(a, b=1, *args, **kwargs)')
-        self.assertEqual(d.pop('rtsignature'),  'B(a, b=1, *args, **kwargs)')
-        self.assertEqual(d.pop('tsignature'),   'B(a, b=1, *args, **kwargs)')
-        self.assertEqual(d.pop('qsignature'),   'B(a, b=1, *args, **kwargs)')
-        self.assertEqual(d.pop('qrtsignature'), 'B(a, b=1, *args, **kwargs)')
-        self.assertEqual(d.pop('qtsignature'),  'B(a, b=1, *args, **kwargs)')
-        self.assertEqual(d.pop('ret'), None)
-        self.assertEqual(d.pop('args'), [
-            {'name': 'a', 'type': None, 'doc': ''},
-            {'name': 'b', 'type': None, 'doc': '', 'default': 1},
-            {'name': '*args', 'type': None, 'doc': ''},
-            {'name': '**kwargs', 'type': None, 'doc': ''},
-        ])
-        self.assertEqual(d.pop('exc'), [])
-        self.assertEqual(d.pop('example'), None)
-        self.assertEqual(d, {})
-
-        # Method: C.f
-        d = exdoc.doc(C.f, C)
-        self.assertEqual(d.pop('module'), 'py-test')
-        self.assertEqual(d.pop('name'), 'f')
-        self.assertEqual(d.pop('qualname'), 'C.f')
-        self.assertEqual(d.pop('doc'), 'Empty function')
-        self.assertEqual(d.pop('clsdoc'), '')
-        self.assertEqual(d.pop('signature'),    'f(a=1)')
-        self.assertEqual(d.pop('rtsignature'),  'f(a=1)')
-        self.assertEqual(d.pop('tsignature'),   'f(a=1)')
-        self.assertEqual(d.pop('qsignature'),   'C.f(a=1)')
-        self.assertEqual(d.pop('qrtsignature'), 'C.f(a=1)')
-        self.assertEqual(d.pop('qtsignature'),  'C.f(a=1)')
-        self.assertEqual(d.pop('ret'), {'type': None, 'doc': 'nothing'})
-        self.assertEqual(d.pop('args'), [
-            {'name': 'a', 'type': None, 'doc': '', 'default': 1}
-        ])
-        self.assertEqual(d.pop('exc'), [])
-        self.assertEqual(d.pop('example'), None)
-        self.assertEqual(d, {})
-
-        # Static Method: C.s
-        d = exdoc.doc(C.s, C)
-        self.assertEqual(d.pop('module'), 'py-test')
-        self.assertEqual(d.pop('name'), 's')
-        self.assertEqual(d.pop('qualname'), 'C.s')
-        self.assertEqual(d.pop('qsignature'),   'C.s(a=2)')
-        self.assertEqual(d.pop('qrtsignature'), 'C.s(a=2) -> None')
-        self.assertEqual(d.pop('qtsignature'),  'C.s(a=2) -> None')
-        self.assertEqual(d.pop('signature'),    's(a=2)')
-        self.assertEqual(d.pop('tsignature'),   's(a=2) -> None')
-        self.assertEqual(d.pop('rtsignature'),  's(a=2) -> None')
-        self.assertEqual(d.pop('doc'), 'Empty static method')
-        self.assertEqual(d.pop('clsdoc'), '')
-        self.assertEqual(d.pop('ret'), {'type': 'None', 'doc': ''})
-        self.assertEqual(d.pop('args'), [
-            {'name': 'a', 'type': None, 'doc': '', 'default': 2}
-        ])
-        self.assertEqual(d.pop('exc'), [])
-        self.assertEqual(d.pop('example'), None)
-        self.assertEqual(d, {})
-
-        # Class Method: C.c
-        d = exdoc.doc(C.c, C)
-        self.assertEqual(d.pop('module'), 'py-test')
-        self.assertEqual(d.pop('name'), 'c')
-        self.assertEqual(d.pop('qualname'), 'C.c')
-        self.assertEqual(d.pop('doc'), '')
-        self.assertEqual(d.pop('clsdoc'), '')
-        self.assertEqual(d.pop('signature'),    'c(a=3)')
-        self.assertEqual(d.pop('rtsignature'),  'c(a=3)')
-        self.assertEqual(d.pop('tsignature'),   'c(a=3)')
-        self.assertEqual(d.pop('qsignature'),   'C.c(a=3)')
-        self.assertEqual(d.pop('qrtsignature'), 'C.c(a=3)')
-        self.assertEqual(d.pop('qtsignature'),  'C.c(a=3)')
-        self.assertEqual(d.pop('ret'), None)
-        self.assertEqual(d.pop('args'), [
-            {'name': 'a', 'type': None, 'doc': '', 'default': 3}
-        ])
-        self.assertEqual(d.pop('exc'), [])
-        self.assertEqual(d.pop('example'), None)
-        self.assertEqual(d, {})
-
-        # Property: C.p
-        d = exdoc.doc(C.p)
-        self.assertEqual(d.pop('module'), 'py-test')
-        self.assertEqual(d.pop('name'), 'p')
-        self.assertEqual(d.pop('qualname'), 'C.p')  # FIXME: wrong name for properties!
-        self.assertEqual(d.pop('qsignature'), 'p')  # FIXME: wrong name for properties!
-        self.assertEqual(d.pop('qrtsignature'), 'C.p(self)')  # FIXME: wrong name for properties!
-        self.assertEqual(d.pop('qtsignature'), 'C.p(self)')  # FIXME: wrong name for properties!
-        self.assertEqual(d.pop('signature'), 'p')
-        self.assertEqual(d.pop('rtsignature'), 'p(self)')
-        self.assertEqual(d.pop('tsignature'), 'p(self)')  # FIXME: wrong name for properties!
-        self.assertEqual(d.pop('doc'), 'Property doc')
-        self.assertEqual(d.pop('clsdoc'), '')
-        self.assertEqual(d.pop('ret'), None)
-        self.assertEqual(d.pop('args'), [])
-        self.assertEqual(d.pop('exc'), [])
-        self.assertEqual(d.pop('example'), None)
-        self.assertEqual(d, {})
+            ],
+            'exc': [
+                {'name': 'AssertionError', 'doc': 'sometimes'}
+            ],
+            'example': None,
+        })
+
+    def test_doc_class_A(self):
+        """ Test doc() on a class """
+        self.assertEqual(dict(self.docs['A']), {
+            'module': 'py-test',
+            'name': 'A',
+            'qualname': 'A',
+            'doc': 'Empty class',
+            'clsdoc': 'Empty class',
+            'signature': 'A(*args, **kwargs)',
+            'tsignature': 'A(*args, **kwargs)',
+            'rtsignature': 'A(*args, **kwargs)',
+            'qsignature': 'A(*args, **kwargs)',
+            'qtsignature': 'A(*args, **kwargs)',
+            'qrtsignature': 'A(*args, **kwargs)',
+            'ret': None,
+            'args': [
+                {'name': '*args', 'type': None, 'doc': ''},
+                {'name': '**kwargs', 'type': None, 'doc': ''},
+            ],
+            'exc': [],
+            'example': None,
+        })
+
+    def test_doc_class_B(self):
+        """ Test doc() on a class with a constructor """
+        self.assertEqual(dict(self.docs['B']), {
+            'module': 'py-test',
+            'name': 'B',
+            'qualname': 'B',
+            'doc': 'Constructor',
+            'clsdoc': 'Class with a constructor',
+            'signature': 'B(a, b=1, *args, **kwargs)',
+            'rtsignature': 'B(a, b=1, *args, **kwargs)',
+            'tsignature': 'B(a, b=1, *args, **kwargs)',
+            'qsignature': 'B(a, b=1, *args, **kwargs)',
+            'qrtsignature': 'B(a, b=1, *args, **kwargs)',
+            'qtsignature': 'B(a, b=1, *args, **kwargs)',
+            'ret': None,
+            'args': [
+                {'name': 'a', 'type': None, 'doc': ''},
+                {'name': 'b', 'type': None, 'doc': '', 'default': 1},
+                {'name': '*args', 'type': None, 'doc': ''},
+                {'name': '**kwargs', 'type': None, 'doc': ''},
+            ],
+            'exc': [],
+            'example': None,
+        })
+
+    def test_doc_method_C_f(self):
+        """ Test doc() on a method """
+        self.assertEqual(dict(self.docs['C.f']), {
+            'module': 'py-test',
+            'name': 'f',
+            'qualname': 'C.f',
+            'doc': 'Empty function',
+            'clsdoc': '',
+            'signature': 'f(a=1)',
+            'rtsignature': 'f(a=1)',
+            'tsignature': 'f(a=1)',
+            'qsignature': 'C.f(a=1)',
+            'qrtsignature': 'C.f(a=1)',
+            'qtsignature': 'C.f(a=1)',
+            'ret': {'type': None, 'doc': 'nothing'},
+            'args': [
+                {'name': 'a', 'type': None, 'doc': '', 'default': 1}
+            ],
+            'exc': [],
+            'example': None,
+        })
+
+    def test_doc_staticmethod_C_s(self):
+        """ Test doc() on a static method """
+        self.assertEqual(dict(self.docs['C.s']), {
+            'module': 'py-test',
+            'name': 's',
+            'qualname': 'C.s',
+            'qsignature': 'C.s(a=2)',
+            'qrtsignature': 'C.s(a=2) -> None',
+            'qtsignature': 'C.s(a=2) -> None',
+            'signature': 's(a=2)',
+            'tsignature': 's(a=2) -> None',
+            'rtsignature': 's(a=2) -> None',
+            'doc': 'Empty static method',
+            'clsdoc': '',
+            'ret': {'type': 'None', 'doc': ''},
+            'args': [
+                {'name': 'a', 'type': None, 'doc': '', 'default': 2}
+            ],
+            'exc': [],
+            'example': None,
+        })
+
+    def test_doc_classmethod_C_c(self):
+        """ Test doc() on a class method """
+        self.assertEqual(dict(self.docs['C.c']), {
+            'module': 'py-test',
+            'name': 'c',
+            'qualname': 'C.c',
+            'doc': '',
+            'clsdoc': '',
+            'signature': 'c(a=3)',
+            'rtsignature': 'c(a=3)',
+            'tsignature': 'c(a=3)',
+            'qsignature': 'C.c(a=3)',
+            'qrtsignature': 'C.c(a=3)',
+            'qtsignature': 'C.c(a=3)',
+            'ret': None,
+            'args': [
+                {'name': 'a', 'type': None, 'doc': '', 'default': 3}
+            ],
+            'exc': [],
+            'example': None,
+        })
+
+    def test_doc_property_C_p(self):
+        """ Test doc() on a property """
+        self.assertEqual(dict(self.docs['C.p']), {
+            'module': 'py-test',
+            'name': 'p',
+            'qualname': 'C.p',  # FIXME: wrong name for properties!
+            'qsignature': 'p',  # FIXME: wrong name for properties!
+            'qrtsignature': 'C.p(self)',  # FIXME: wrong name for properties!
+            'qtsignature': 'C.p(self)',  # FIXME: wrong name for properties!
+            'signature': 'p',
+            'rtsignature': 'p(self)',
+            'tsignature': 'p(self)',  # FIXME: wrong name for properties!
+            'doc': 'Property doc',
+            'clsdoc': '',
+            'ret': None,
+            'args': [],
+            'exc': [],
+            'example': None,
+        })
 
     def test_doc_specific(self):
         """ Test specific stuff on doc() """
@@ -279,6 +300,101 @@ class PyTest(unittest.TestCase):
             dict(name='**kwargs',   type=None,              doc='And keywords')
         ])
 
+        # Built-ins: with and without a text signature
+        self.assertEqual(exdoc.doc(len)['signature'], 'len(obj)')
+        self.assertEqual(exdoc.doc(iter)['signature'], 'iter()')
+        # Classes re-exported by a public module are documented under its name
+        self.assertEqual(exdoc.doc(io.StringIO)['module'], 'io')
+        # Built-in classmethods: only `cls` is dropped
+        self.assertEqual(exdoc.doc(dict.fromkeys, dict)['signature'], 'fromkeys(iterable, value=None)')
+
+        # Docstrings are read anew every time
+        class K:
+            """ Old """
+        self.assertEqual(exdoc.doc(K)['doc'], 'Old')
+        K.__doc__ = 'New'
+        self.assertEqual(exdoc.doc(K)['doc'], 'New')
+
+        # Signatures too
+        def f(a=1): pass
+        self.assertEqual(exdoc.doc(f)['signature'], 'f(a=1)')
+        f.__defaults__ = (2,)
+        self.assertEqual(exdoc.doc(f)['signature'], 'f(a=2)')
+
+        # Any default is kept, `NotImplemented` included
+        def f(a=NotImplemented, b=1): pass
+        self.assertEqual(exdoc.doc(f)['signature'], 'f(a=NotImplemented, b=1)')
+        self.assertEqual(exdoc.doc(f)['args'][0]['default'], NotImplemented)
+
+        # Sphinx tags are listed in the order of the docstring
+        def f():
+            """ Raises
+
+            :raises KeyError: first
+            :raises ValueError: second
+            """
+        self.assertEqual(exdoc.doc(f)['exc'], [
+            dict(name='KeyError',   doc='first'),
+            dict(name='ValueError', doc='second'),
+        ])
+
+    def test_sphinx_tags(self):
+        """ Test every Sphinx tag variant """
+        def f(a, b):
+            """ Sphinx
+
+            :param a: A
+            :type a: int
+            :param  b : B
+            :type b:str
+            :returns: ret
+            :rtype: bool
+            :raise KeyError: k
+            :raises ValueError: v
+            :except IndexError: i
+            :exception TypeError: t
+            """
+        d = exdoc.doc(f)
+        self.assertEqual(d['doc'], 'Sphinx')
+        self.assertEqual(d['args'], [
+            {'name': 'a', 'type': 'int', 'doc': 'A'},
+            {'name': 'b', 'type': 'str', 'doc': 'B'},
+        ])
+        self.assertEqual(d['ret'], {'type': 'bool', 'doc': 'ret'})
+        self.assertEqual(d['exc'], [
+            {'name': 'KeyError', 'doc': 'k'},
+            {'name': 'ValueError', 'doc': 'v'},
+            {'name': 'IndexError', 'doc': 'i'},
+            {'name': 'TypeError', 'doc': 't'},
+        ])
+
+        # `:return:` without the 's'; tags never span lines
+        def g():
+            """ Sphinx
+
+            :return: ret
+            :param
+            a: not a tag
+            """
+        d = exdoc.doc(g)
+        self.assertEqual(d['doc'], 'Sphinx')
+        self.assertEqual(d['ret'], {'type': None, 'doc': 'ret\n:param\na: not a tag'})
+
+        # Repeated tags: the first one wins
+        def h(a):
+            """ Sphinx
+
+            :param a: first
+            :type a: int
+            :param a: second
+            :type a: str
+            :return: first
+            :returns: second
+            """
+        d = exdoc.doc(h)
+        self.assertEqual(d['args'], [{'name': 'a', 'type': 'int', 'doc': 'first'}])
+        self.assertEqual(d['ret'], {'type': None, 'doc': 'first'})
+
     def test_google_docstring(self):
         # === Test: Function
         # Test the args section
@@ -401,6 +517,26 @@ class PyTest(unittest.TestCase):
         ])
         self.assertEqual(d['example'], 'a\n    b\nc')
 
+        # Test repeated sections: the first one wins
+        def f8_repeated():
+            """ Google 8
+
+                Returns:
+                    first
+                Yields:
+                    second
+                Raises:
+                    KeyError: first
+                Raises:
+                    ValueError: second
+            """
+        d = exdoc.doc(f8_repeated)
+        self.assertEqual(d['ret'], {'type': None, 'doc': 'first'})
+        self.assertEqual(d['exc'], [
+            {'name': 'ValueError', 'doc': 'second'},
+            {'name': 'KeyError', 'doc': 'first'},
+        ])
+
         # Test conflict
         def f4_example():
             """ Sphinx
@@ -463,6 +599,25 @@ class PyTest(unittest.TestCase):
         self.assertEqual(d['ret'], {'type': 'PyTest', 'doc': ''})
 
 
+    def test_doc_many(self):
+        """ Test doc_many() """
+        for workers in (1, 4):
+            self.assertEqual(exdoc.doc_many([h, A, B], workers=workers),
+                             [exdoc.doc(h), exdoc.doc(A), exdoc.doc(B)])
+            self.assertEqual(exdoc.doc_many([C.f, C.s], C, workers=workers),
+                             [exdoc.doc(C.f, C), exdoc.doc(C.s, C)])
+
+            # Repeated objects get results of their own
+            d = exdoc.doc_many([h, A, h], workers=workers)
+            self.assertEqual(d, [exdoc.doc(h), exdoc.doc(A), exdoc.doc(h)])
+            d[0]['args'].pop()
+            self.assertEqual(d[2], exdoc.doc(h))
+
+        # Processes: objects have to be picklable
+        objs = [exdoc.doc, exdoc.getmembers, exdoc.subclasses]
+        self.assertEqual(exdoc.doc_many(objs, workers=2, processes=True),
+                         [exdoc.doc(obj) for obj in objs])
+
     def test_getmembers(self):
         """ Test getmembers() """
         m = exdoc.getmembers(C)
@@ -480,11 +635,27 @@ class PyTest(unittest.TestCase):
             ('f', C.f),
         ])
 
+    def test_dictproxy(self):
+        """ Test DictProxy attributes """
+        v = data.ValueDoc('x')
+        v.type = 'int'
+        v._meta = 1  # private attributes are not stored in the dict
+        self.assertEqual(v, {'doc': 'x', 'type': 'int'})
+        self.assertEqual(v._meta, 1)
+
     def test_subclasses(self):
         """ Test subclasses() """
         self.assertEqual(exdoc.subclasses(A), [A, B, C])
         self.assertEqual(exdoc.subclasses(A, leaves=True), [C])
 
+        # Diamond inheritance: D is reachable twice, but listed once
+        class Z: pass
+        class Z1(Z): pass
+        class Z2(Z): pass
+        class D(Z1, Z2): pass
+        self.assertEqual(exdoc.subclasses(Z), [Z, Z2, D, Z1])
+        self.assertEqual(exdoc.subclasses(Z, leaves=True), [D])
+
 
     def test_real_world_issues(self):
         """ Test some real-world issues we've had with the parser """